@@ -19,6 +19,8 @@ import pyaedt
 import pyedb
 from pyedb.misc.downloads import download_file
 
+_RLC = frozenset(("Resistor", "Capacitor", "Inductor"))
+
 # ### Download file
 #
 # Download the AEDB file and copy it in the temporary folder.
@@ -56,43 +58,38 @@ all_nets = edbapp.extended_nets.auto_identify_signal(resistor_below=10, inductor
 diff_p = edbapp.nets["PCIe_Gen4_TX3_CAP_P"]
 diff_n = edbapp.nets["PCIe_Gen4_TX3_CAP_N"]
 
-nets_p = list(diff_p.extended_net.nets.keys())
-nets_n = list(diff_n.extended_net.nets.keys())
-
-comp_p = list(diff_p.extended_net.components.keys())
-comp_n = list(diff_n.extended_net.components.keys())
+nets_p = list(diff_p.extended_net.nets)
+nets_n = list(diff_n.extended_net.nets)
 
-rlc_p = list(diff_p.extended_net.rlc.keys())
-rlc_n = list(diff_n.extended_net.rlc.keys())
-
-print(comp_p, rlc_p, comp_n, rlc_n, sep="\n")
+print(
+    list(diff_p.extended_net.components),
+    list(diff_p.extended_net.rlc),
+    list(diff_n.extended_net.components),
+    list(diff_n.extended_net.rlc),
+    sep="\n",
+)
 # -
 
 # Prepare input data for port creation.
 
 # +
+seen = set()
 ports = []
-for net_name, net_obj in diff_p.extended_net.nets.items():
-    for comp_name, comp_obj in net_obj.components.items():
-        if comp_obj.type not in ["Resistor", "Capacitor", "Inductor"]:
-            ports.append(
-                {
-                    "port_name": "{}_{}".format(comp_name, net_name),
-                    "comp_name": comp_name,
-                    "net_name": net_name,
-                }
-            )
-
-for net_name, net_obj in diff_n.extended_net.nets.items():
-    for comp_name, comp_obj in net_obj.components.items():
-        if comp_obj.type not in ["Resistor", "Capacitor", "Inductor"]:
-            ports.append(
-                {
-                    "port_name": "{}_{}".format(comp_name, net_name),
-                    "comp_name": comp_name,
-                    "net_name": net_name,
-                }
-            )
+for diff in (diff_p, diff_n):
+    net_comps = {net_name: net_obj.components for net_name, net_obj in diff.extended_net.nets.items()}
+    ext_comps = {name: comp_obj for comps in net_comps.values() for name, comp_obj in comps.items()}
+    drivers = {name for name, comp_obj in ext_comps.items() if comp_obj.type not in _RLC}
+    for net_name, comps in net_comps.items():
+        for comp_name in comps:
+            if comp_name in drivers and (comp_name, net_name) not in seen:
+                seen.add((comp_name, net_name))
+                ports.append(
+                    {
+                        "port_name": f"{comp_name}_{net_name}",
+                        "comp_name": comp_name,
+                        "net_name": net_name,
+                    }
+                )
 
 print(*ports, sep="\n")
 # -
@@ -101,19 +98,13 @@ print(*ports, sep="\n")
 #
 # Solder balls are generated automatically. The default port type is coax port.
 
-for d in ports:
-    port_name = d["port_name"]
-    comp_name = d["comp_name"]
-    net_name = d["net_name"]
-    edbapp.components.create_port_on_component(component=comp_name, net_list=net_name, port_name=port_name)
+edbapp.components.create_ports_on_components(ports)
 
 # ### Cutout
 #
 # Retain only relevant parts of the layout.
 
-nets = []
-nets.extend(nets_p)
-nets.extend(nets_n)
+nets = list(dict.fromkeys(nets_p + nets_n))
 edbapp.cutout(signal_list=nets, reference_list=["GND"], extent_type="Bounding")
 
 # Set up the model for network analysis in SIwave.
@@ -140,7 +131,7 @@ edbapp.close_edb()
 
 h3d = pyaedt.Hfss3dLayout(
     edb_full_path,
-    specified_version="2024.1",
+    specified_version=edb_version,
     non_graphical=False,  # Set to true for non-graphical mode.
     new_desktop_session=True,
 )
@@ -20,6 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import copy
+from functools import cached_property
+import sys
 
 from pyedb.configuration.cfg_boundaries import CfgBoundaries
 from pyedb.configuration.cfg_components import CfgComponents
@@ -36,44 +39,104 @@ from pyedb.configuration.cfg_spice_models import CfgSpiceModel
 from pyedb.configuration.cfg_stackup import CfgStackup
 
 
-class CfgData(object):
-    """Manages configure data."""
+class CfgData:
+    """Manages configure data.
+
+    Each configuration section is parsed on first access, so errors in a malformed section are deferred until the
+    section is read. Use :func:`parse` to parse all sections up front.
+    """
 
     def __init__(self, pedb, **kwargs):
         self._pedb = pedb
-        self.general = CfgGeneral(self, kwargs.get("general", None))
-
-        self.boundaries = {}
-        if kwargs.get("boundaries", None):
-            self.boundaries = CfgBoundaries(self, kwargs.get("boundaries", None))
-
-        self.nets = CfgNets(
-            self, kwargs.get("nets", {}).get("signal_nets", []), kwargs.get("nets", {}).get("power_ground_nets", [])
-        )
-
-        self.components = CfgComponents(self._pedb, components_data=kwargs.get("components", []))
-
-        self.padstacks = CfgPadstacks(self, kwargs.get("padstacks", None))
-
-        self.pin_groups = CfgPinGroups(self._pedb, pingroup_data=kwargs.get("pin_groups", []))
-
-        self.ports = CfgPorts(self._pedb, ports_data=kwargs.get("ports", []))
-
-        self.sources = CfgSources(self._pedb, sources_data=kwargs.get("sources", []))
+        self._kwargs = {sys.intern(k): self._copy_section(v) for k, v in kwargs.items()}
+
+    @staticmethod
+    def _copy_section(value):
+        """Shallow-copy a configuration section, interning the keys of dictionary sections."""
+        if isinstance(value, dict):
+            return {sys.intern(k) if isinstance(k, str) else k: v for k, v in value.items()}
+        return copy.copy(value)
+
+    def parse(self):
+        """Parse all configuration sections.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful. Errors in malformed sections are raised.
+        """
+        for section in self._sections:
+            getattr(self, section)
+        return True
+
+    @cached_property
+    def general(self):
+        return CfgGeneral(self, self._kwargs.get("general", None))
+
+    @cached_property
+    def boundaries(self):
+        boundaries = self._kwargs.get("boundaries")
+        return CfgBoundaries(self, boundaries) if boundaries else {}
+
+    @cached_property
+    def nets(self):
+        nets = self._kwargs.get("nets")
+        if nets:
+            return CfgNets(self, nets.get("signal_nets", []), nets.get("power_ground_nets", []))
+        return CfgNets(self)
+
+    @cached_property
+    def components(self):
+        return CfgComponents(self._pedb, components_data=self._kwargs.get("components") or ())
+
+    @cached_property
+    def padstacks(self):
+        return CfgPadstacks(self, self._kwargs.get("padstacks", None))
+
+    @cached_property
+    def pin_groups(self):
+        return CfgPinGroups(self._pedb, pingroup_data=self._kwargs.get("pin_groups") or ())
+
+    @cached_property
+    def ports(self):
+        return CfgPorts(self._pedb, ports_data=self._kwargs.get("ports") or ())
+
+    @cached_property
+    def sources(self):
+        return CfgSources(self._pedb, sources_data=self._kwargs.get("sources") or ())
+
+    @cached_property
+    def setups(self):
+        return CfgSetups(self._pedb, setups_data=self._kwargs.get("setups") or ())
+
+    @cached_property
+    def stackup(self):
+        return CfgStackup(self._pedb, data=self._kwargs.get("stackup", {}))
+
+    @cached_property
+    def s_parameters(self):
+        s_parameter_library = self.general.s_parameter_library
+        return [
+            CfgSParameterModel(self, s_parameter_library, sparam_model)
+            for sparam_model in self._kwargs.get("s_parameters") or ()
+        ]
 
-        self.setups = CfgSetups(self._pedb, setups_data=kwargs.get("setups", []))
+    @cached_property
+    def spice_models(self):
+        spice_model_library = self.general.spice_model_library
+        return [
+            CfgSpiceModel(self, spice_model_library, spice_model)
+            for spice_model in self._kwargs.get("spice_models") or ()
+        ]
 
-        self.stackup = CfgStackup(self._pedb, data=kwargs.get("stackup", {}))
+    @cached_property
+    def package_definitions(self):
+        return CfgPackageDefinitions(self._pedb, data=self._kwargs.get("package_definitions") or ())
 
-        self.s_parameters = [
-            CfgSParameterModel(self, self.general.s_parameter_library, sparam_model)
-            for sparam_model in kwargs.get("s_parameters", [])
-        ]
+    @cached_property
+    def operations(self):
+        return CfgOperations(self._pedb, data=self._kwargs.get("operations", []))
 
-        self.spice_models = [
-            CfgSpiceModel(self, self.general.spice_model_library, spice_model)
-            for spice_model in kwargs.get("spice_models", [])
-        ]
 
-        self.package_definitions = CfgPackageDefinitions(self._pedb, data=kwargs.get("package_definitions", []))
-        self.operations = CfgOperations(self._pedb, data=kwargs.get("operations", []))
+# Sections parsed by CfgData.parse, taken from the class so that new cached properties are always validated.
+CfgData._sections = tuple(name for name, value in vars(CfgData).items() if isinstance(value, cached_property))
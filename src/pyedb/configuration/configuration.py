@@ -35,7 +35,6 @@ class Configuration:
 
     def __init__(self, pedb):
         self._pedb = pedb
-        self._components = self._pedb.components.components
         self.data = {}
         self._s_parameter_library = ""
         self._spice_model_library = ""
@@ -92,6 +91,7 @@ class Configuration:
         self.cfg_data = CfgData(self._pedb, **self.data)
 
         if apply_file:
+            self.cfg_data.parse()
             original_file = self._pedb.edbpath
             if output_file:
                 self._pedb.save_edb_as(output_file)
@@ -105,6 +105,9 @@ class Configuration:
 
     def run(self):
         """Apply configuration settings to the current design"""
+        # Parse every section before applying any of them so that a malformed section does not leave the design
+        # partially configured.
+        self.cfg_data.parse()
 
         # Configure boundary settings
         if self.cfg_data.boundaries:
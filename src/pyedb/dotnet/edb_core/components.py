@@ -969,34 +969,9 @@ class Components(object):
                     "outside the component automatically when not found."
                 )
                 return False
-            pad_params = self._padstack.get_pad_parameters(pin=cmp_pins[0], layername=pin_layers[0], pad_type=0)
-            if not pad_params[0] == 7:
-                if not solder_balls_size:  # pragma no cover
-                    sball_diam = min([self._pedb.edb_value(val).ToDouble() for val in pad_params[1]])
-                    sball_mid_diam = sball_diam
-                else:  # pragma no cover
-                    sball_diam = solder_balls_size
-                    if solder_balls_mid_size:
-                        sball_mid_diam = solder_balls_mid_size
-                    else:
-                        sball_mid_diam = solder_balls_size
-                if not solder_balls_height:  # pragma no cover
-                    solder_balls_height = 2 * sball_diam / 3
-            else:  # pragma no cover
-                if not solder_balls_size:
-                    bbox = pad_params[1]
-                    sball_diam = min([abs(bbox[2] - bbox[0]), abs(bbox[3] - bbox[1])]) * 0.8
-                else:
-                    sball_diam = solder_balls_size
-                if not solder_balls_height:
-                    solder_balls_height = 2 * sball_diam / 3
-                if solder_balls_mid_size:
-                    sball_mid_diam = solder_balls_mid_size
-                else:
-                    sball_mid_diam = sball_diam
-            sball_shape = "Cylinder"
-            if not sball_diam == sball_mid_diam:
-                sball_shape = "Spheroid"
+            solder_balls_height, sball_diam, sball_mid_diam, sball_shape = self._get_solder_ball_parameters(
+                cmp_pins[0], pin_layers[0], solder_balls_height, solder_balls_size, solder_balls_mid_size
+            )
             self.set_solder_ball(
                 component=component,
                 sball_height=solder_balls_height,
@@ -1073,6 +1048,180 @@ class Components(object):
                                 )
         return True
 
+    def create_ports_on_components(
+        self,
+        port_specs,
+        port_type=SourceType.CoaxPort,
+        do_pingroup=True,
+        reference_net="gnd",
+        solder_balls_height=None,
+        solder_balls_size=None,
+        solder_balls_mid_size=None,
+    ):
+        """Create ports on several components in a single pass.
+
+        Specifications are grouped by component so that the component lookup, the pin search and the
+        solder ball generation are done once per component instead of once per port. Circuit ports are
+        created with one :func:`create_port_on_component` call per component, which ignores ``"port_name"``.
+
+        Parameters
+        ----------
+        port_specs : list of dict
+            Port specifications. Each dictionary provides the ``"comp_name"`` and ``"net_name"`` keys and
+            optionally a ``"port_name"`` key. ``"comp_name"`` can be a component name or an EDB component.
+        port_type : SourceType enumerator, CoaxPort or CircuitPort
+            Type of port to create. ``CoaxPort`` generates solder balls.
+            ``CircuitPort`` generates circuit ports on pins belonging to the net list.
+        do_pingroup : bool
+            True activate pingroup during port creation (only used with combination of CircPort),
+            False will take the closest reference pin and generate one port per signal pin.
+        reference_net : string or list of string.
+            list of the reference net.
+        solder_balls_height : float, optional
+            Solder balls height used for the components. When provided default value is overwritten and must be
+            provided in meter.
+        solder_balls_size : float, optional
+            Solder balls diameter. When provided auto evaluation based on padstack size will be disabled.
+        solder_balls_mid_size : float, optional
+            Solder balls mid-diameter. When provided if value is different than solder balls size, spheroid shape will
+            be switched.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+
+        Examples
+        --------
+
+        >>> from pyedb import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> ports = [{"port_name": "U1_M_DQ<1>", "comp_name": "U1", "net_name": "M_DQ<1>"},
+        >>>          {"port_name": "U1_M_DQ<2>", "comp_name": "U1", "net_name": "M_DQ<2>"}]
+        >>> edbapp.components.create_ports_on_components(ports, reference_net="GND")
+
+        """
+        specs_by_comp = {}
+        for spec in port_specs:
+            comp_name = spec["comp_name"]
+            if isinstance(comp_name, EDBComponent):
+                comp_name = comp_name.refdes
+            elif not isinstance(comp_name, str):
+                comp_name = comp_name.GetName()
+            specs_by_comp.setdefault(comp_name, []).append(spec)
+
+        if port_type != SourceType.CoaxPort:  # pragma no cover
+            # Circuit ports follow the default naming convention, so the nets of each component are created in a
+            # single call that resolves the reference pins once.
+            result = True
+            for comp_name, specs in specs_by_comp.items():
+                result &= bool(
+                    self.create_port_on_component(
+                        comp_name,
+                        list(dict.fromkeys(spec["net_name"] for spec in specs)),
+                        port_type=port_type,
+                        do_pingroup=do_pingroup,
+                        reference_net=reference_net,
+                    )
+                )
+            return result
+
+        result = True
+        for comp_name, specs in specs_by_comp.items():
+            comp = self.instances[comp_name]
+            component = comp.edbcomponent
+            net_names = {spec["net_name"] for spec in specs}
+            pins_by_net = {}
+            ref_pins = []
+            for p in list(component.LayoutObjs):
+                if not int(p.GetObjType()) == 1:
+                    continue
+                pin_net = p.GetNet().GetName()
+                if pin_net in net_names and pin_net != reference_net:
+                    pins_by_net.setdefault(pin_net, []).append(p)
+                elif pin_net in reference_net:
+                    ref_pins.append(p)
+            if not pins_by_net:
+                self._logger.info("No pins found on component {} for nets {}".format(comp_name, sorted(net_names)))
+                result = False
+                continue
+            if not ref_pins:
+                self._logger.error("No reference pins found on component {}.".format(comp_name))
+                result = False
+                continue
+            for pins in pins_by_net.values():  # pragma no cover
+                for p in pins:
+                    if not p.IsLayoutPin():
+                        p.SetIsLayoutPin(True)
+            # Solder balls are evaluated from the first pin of the first specified net, like the first call of
+            # create_port_on_component does before the later calls reuse the stored solder ball properties.
+            first_net = next(spec["net_name"] for spec in specs if spec["net_name"] in pins_by_net)
+            first_pin = pins_by_net[first_net][0]
+            pin_layer = first_pin.GetPadstackDef().GetData().GetLayerNames()[0]
+            sball_height, sball_diam, sball_mid_diam, sball_shape = self._get_solder_ball_parameters(
+                first_pin,
+                pin_layer,
+                solder_balls_height if solder_balls_height else comp.solder_ball_height,
+                solder_balls_size if solder_balls_size else comp.solder_ball_diameter[0],
+                solder_balls_mid_size if solder_balls_mid_size else comp.solder_ball_diameter[1],
+            )
+            self.set_solder_ball(
+                component=component,
+                sball_height=sball_height,
+                sball_diam=sball_diam,
+                sball_mid_diam=sball_mid_diam,
+                shape=sball_shape,
+            )
+            for spec in specs:
+                net_name = spec["net_name"]
+                if net_name not in pins_by_net:
+                    self._logger.info("No pins found on component {} for the net {}".format(comp_name, net_name))
+                    result = False
+                    continue
+                for pin in pins_by_net[net_name]:
+                    self._padstack.create_coax_port(padstackinstance=pin, name=spec.get("port_name"))
+        return result
+
+    def _get_solder_ball_parameters(
+        self, pin, layer_name, solder_balls_height=None, solder_balls_size=None, solder_balls_mid_size=None
+    ):
+        """Evaluate solder ball height, diameters and shape from the pad of a pin.
+
+        Returns
+        -------
+        tuple
+            Solder ball height, diameter, mid-diameter and shape.
+        """
+        pad_params = self._padstack.get_pad_parameters(pin=pin, layername=layer_name, pad_type=0)
+        if not pad_params[0] == 7:
+            if not solder_balls_size:  # pragma no cover
+                sball_diam = min([self._pedb.edb_value(val).ToDouble() for val in pad_params[1]])
+                sball_mid_diam = sball_diam
+            else:  # pragma no cover
+                sball_diam = solder_balls_size
+                if solder_balls_mid_size:
+                    sball_mid_diam = solder_balls_mid_size
+                else:
+                    sball_mid_diam = solder_balls_size
+            if not solder_balls_height:  # pragma no cover
+                solder_balls_height = 2 * sball_diam / 3
+        else:  # pragma no cover
+            if not solder_balls_size:
+                bbox = pad_params[1]
+                sball_diam = min([abs(bbox[2] - bbox[0]), abs(bbox[3] - bbox[1])]) * 0.8
+            else:
+                sball_diam = solder_balls_size
+            if not solder_balls_height:
+                solder_balls_height = 2 * sball_diam / 3
+            if solder_balls_mid_size:
+                sball_mid_diam = solder_balls_mid_size
+            else:
+                sball_mid_diam = sball_diam
+        sball_shape = "Cylinder"
+        if not sball_diam == sball_mid_diam:
+            sball_shape = "Spheroid"
+        return solder_balls_height, sball_diam, sball_mid_diam, sball_shape
+
     def _create_terminal(self, pin, term_name=None):
         """Create terminal on component pin.
 
@@ -20,10 +20,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 
+from pyedb.dotnet.edb_core.cell.hierarchy.component import EDBComponent
 from pyedb.dotnet.edb_core.definition.component_model import NPortComponentModel
 from pyedb.dotnet.edb_core.utilities.obj_base import ObjBase
+from pyedb.generic.general_methods import get_filename_without_extension
 
 
 class EDBComponentDef(ObjBase):
@@ -35,15 +38,21 @@ class EDBComponentDef(ObjBase):
         Inherited AEDT object.
     edb_object : object
         Edb ComponentDef Object
+    use_cache : bool, optional
+        Whether to reuse the components found for this definition between calls. Set it to ``False``
+        when EDB is edited outside of pyedb. The default is ``True``.
     """
 
-    def __init__(self, pedb, edb_object=None):
+    def __init__(self, pedb, edb_object=None, use_cache=True):
         super().__init__(pedb, edb_object)
         self._pedb = pedb
+        self.use_cache = use_cache
+        self._components_cache = None
+        self._find_by_def = None
 
     @property
     def _comp_model(self):
-        return list(self._edb_object.GetComponentModels())  # pragma: no cover
+        return list(self._edb_object.GetComponentModels())
 
     @property
     def part_name(self):
@@ -53,6 +62,7 @@ class EDBComponentDef(ObjBase):
     @part_name.setter
     def part_name(self, name):
         self._edb_object.SetName(name)
+        self.invalidate_components()
 
     @property
     def type(self):
@@ -62,17 +72,20 @@ class EDBComponentDef(ObjBase):
         -------
         str
         """
-        num = len(set(comp.type for refdes, comp in self.components.items()))
-        if num == 0:  # pragma: no cover
+        comps = iter(self.components.values())
+        first = next(comps, None)
+        if first is None:  # pragma: no cover
             return None
-        elif num == 1:
-            return list(self.components.values())[0].type
-        else:
-            return "mixed"  # pragma: no cover
+        comp_type = first.type
+        for comp in comps:
+            if comp.type != comp_type:  # pragma: no cover
+                return "mixed"
+        return comp_type
 
     @type.setter
     def type(self, value):
-        for comp in list(self.components.values()):
+        comps = self.components
+        for comp in comps.values():
             comp.type = value
 
     @property
@@ -83,17 +96,42 @@ class EDBComponentDef(ObjBase):
         -------
         dict of :class:`EDBComponent`
         """
-        from pyedb.dotnet.edb_core.cell.hierarchy.component import EDBComponent
+        if self.use_cache and self._components_cache is not None:
+            return self._components_cache
+        if self._find_by_def is None:
+            self._find_by_def = self._pedb.edb_api.cell.hierarchy.component.FindByComponentDef
+        comps = {}
+        for edb_object in self._find_by_def(self._pedb.active_layout, self.part_name):
+            comp = EDBComponent(self._pedb, edb_object)
+            comps[comp.refdes] = comp
+        self._components_cache = comps
+        return comps
+
+    def invalidate_components(self):
+        """Clear the cached components so that they are retrieved from EDB on next access."""
+        self._components_cache = None
+
+    def _apply_to_components(self, func, parallel=False):
+        """Call a function on every component under this part name.
 
-        comp_list = [
-            EDBComponent(self._pedb, l)
-            for l in self._pedb.edb_api.cell.hierarchy.component.FindByComponentDef(
-                self._pedb.active_layout, self.part_name
-            )
-        ]
-        return {comp.refdes: comp for comp in comp_list}
+        Parameters
+        ----------
+        func : callable
+            Function taking an :class:`EDBComponent` as its only argument.
+        parallel : bool, optional
+            Whether to dispatch the calls to a thread pool when the definition has more than 16 components.
+            The default is ``False``.
+        """
+        comps = list(self.components.values())
+        if parallel and len(comps) > 16:
+            with ThreadPoolExecutor(max_workers=min(8, len(comps))) as pool:
+                list(pool.map(func, comps))
+        else:
+            for comp in comps:
+                func(comp)
+        return True
 
-    def assign_rlc_model(self, res=None, ind=None, cap=None, is_parallel=False):
+    def assign_rlc_model(self, res=None, ind=None, cap=None, is_parallel=False, parallel=False):
         """Assign RLC to all components under this part name.
 
         Parameters
@@ -106,13 +144,12 @@ class EDBComponentDef(ObjBase):
             Capacitance. Default is ``None``.
         is_parallel : bool, optional
             Whether it is parallel or series RLC component.
+        parallel : bool, optional
+            Whether to assign the model to the components from a thread pool. The default is ``False``.
         """
-        for comp in list(self.components.values()):
-            res, ind, cap = res, ind, cap
-            comp.assign_rlc_model(res, ind, cap, is_parallel)
-        return True
+        return self._apply_to_components(lambda comp: comp.assign_rlc_model(res, ind, cap, is_parallel), parallel)
 
-    def assign_s_param_model(self, file_path, model_name=None, reference_net=None):
+    def assign_s_param_model(self, file_path, model_name=None, reference_net=None, parallel=False):
         """Assign S-parameter to all components under this part name.
 
         Parameters
@@ -121,16 +158,21 @@ class EDBComponentDef(ObjBase):
             File path of the S-parameter model.
         name : str, optional
             Name of the S-parameter model.
+        parallel : bool, optional
+            Whether to assign the model to the components from a thread pool. The default is ``False``.
 
         Returns
         -------
 
         """
-        for comp in list(self.components.values()):
-            comp.assign_s_param_model(file_path, model_name, reference_net)
-        return True
-
-    def assign_spice_model(self, file_path, model_name=None):
+        if not model_name:
+            model_name = get_filename_without_extension(file_path)
+        # The n-port model lives on the shared definition, so it is added once before the components are visited.
+        if self._pedb.definition.NPortComponentModel.FindByName(self._edb_object, model_name).IsNull():
+            self.add_n_port_model(file_path, model_name)
+        return self._apply_to_components(lambda comp: comp.use_s_parameter_model(model_name, reference_net), parallel)
+
+    def assign_spice_model(self, file_path, model_name=None, parallel=False):
         """Assign Spice model to all components under this part name.
 
         Parameters
@@ -139,14 +181,14 @@ class EDBComponentDef(ObjBase):
             File path of the Spice model.
         name : str, optional
             Name of the Spice model.
+        parallel : bool, optional
+            Whether to assign the model to the components from a thread pool. The default is ``False``.
 
         Returns
         -------
 
         """
-        for comp in list(self.components.values()):
-            comp.assign_spice_model(file_path, model_name)
-        return True
+        return self._apply_to_components(lambda comp: comp.assign_spice_model(file_path, model_name), parallel)
 
     @property
     def reference_file(self):
@@ -160,27 +202,36 @@ class EDBComponentDef(ObjBase):
     @property
     def component_models(self):
         temp = {}
-        for i in list(self._edb_object.GetComponentModels()):
-            temp_type = i.ToString().split(".")[0]
-            if temp_type == "NPortComponentModel":
+        for i in self._comp_model:
+            if str(i.GetComponentModelType()) == "NPortComponentModel":
                 edb_object = NPortComponentModel(self._pedb, i)
                 temp[edb_object.name] = edb_object
         return temp
 
-    def _add_component_model(self, value):
-        self._edb_object.AddComponentModel(value._edb_object)
-
     def add_n_port_model(self, fpath, name=None):
-        if not name:
-            name = os.path.splitext(os.path.basename(fpath)[0])
+        """Add an n-port model to this component definition.
+
+        Parameters
+        ----------
+        fpath : str
+            File path of the S-parameter model.
+        name : str, optional
+            Name of the model. The default is ``None``, in which case the file name without extension is used.
 
-        from pyedb.dotnet.edb_core.definition.component_model import NPortComponentModel
+        Returns
+        -------
+        :class:`pyedb.dotnet.edb_core.definition.component_model.NPortComponentModel`
+        """
+        if not name:
+            name = os.path.splitext(os.path.basename(fpath))[0]
 
         edb_object = self._pedb.definition.NPortComponentModel.Create(name)
         n_port_comp_model = NPortComponentModel(self._pedb, edb_object)
         n_port_comp_model.reference_file = fpath
 
-        self._add_component_model(n_port_comp_model)
+        self._edb_object.AddComponentModel(edb_object)
+        self.invalidate_components()
+        return n_port_comp_model
 
     def create(self, name):
         cell_type = self._pedb.edb_api.cell.CellType.FootprintCell
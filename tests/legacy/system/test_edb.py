@@ -171,6 +171,41 @@ class TestClass:
         mesh_ops = self.edbapp.hfss.get_trace_width_for_traces_with_ports()
         assert len(mesh_ops) > 0
 
+    def test_create_ports_on_components(self):
+        """Create ports on a component in a single call."""
+        source_path = os.path.join(local_path, "example_models", test_subfolder, "ANSYS-HSD_V1.aedb")
+        target_path = os.path.join(self.local_scratch.path, "test_create_ports_on_components_scalar.aedb")
+        self.local_scratch.copyfolder(source_path, target_path)
+        edb_scalar = Edb(target_path, edbversion=desktop_version)
+        for net_name in ["DDR4_DQS0_P", "DDR4_DQS0_N"]:
+            edb_scalar.components.create_port_on_component(
+                "U1", net_name, reference_net="GND", port_name="U1_{}".format(net_name)
+            )
+
+        target_path = os.path.join(self.local_scratch.path, "test_create_ports_on_components_batch.aedb")
+        self.local_scratch.copyfolder(source_path, target_path)
+        edbapp = Edb(target_path, edbversion=desktop_version)
+        ports = [
+            {"port_name": "U1_DDR4_DQS0_P", "comp_name": "U1", "net_name": "DDR4_DQS0_P"},
+            {"port_name": "U1_DDR4_DQS0_N", "comp_name": edbapp.components["U1"], "net_name": "DDR4_DQS0_N"},
+        ]
+        assert edbapp.components.create_ports_on_components(ports, reference_net="GND")
+        assert len(edbapp.ports) == 2
+        assert set(edbapp.ports) == {"U1_DDR4_DQS0_P", "U1_DDR4_DQS0_N"}
+        assert set(edbapp.ports) == set(edb_scalar.ports)
+        assert edbapp.components["U1"].solder_ball_height == edb_scalar.components["U1"].solder_ball_height
+        assert edbapp.components["U1"].solder_ball_diameter == edb_scalar.components["U1"].solder_ball_diameter
+        assert edbapp.components["U1"].solder_ball_shape == edb_scalar.components["U1"].solder_ball_shape
+        ports = [
+            {"port_name": "U1_DDR4_DQS1_P", "comp_name": "U1", "net_name": "DDR4_DQS1_P"},
+            {"port_name": "U1_NOT_A_NET", "comp_name": "U1", "net_name": "NOT_A_U1_NET"},
+        ]
+        assert not edbapp.components.create_ports_on_components(ports, reference_net="GND")
+        assert "U1_DDR4_DQS1_P" in edbapp.ports
+        assert "U1_NOT_A_NET" not in edbapp.ports
+        edb_scalar.close()
+        edbapp.close()
+
     def test_add_variables(self):
         """Add design and project variables."""
         result, var_server = self.edbapp.add_design_variable("my_variable", "1mm")
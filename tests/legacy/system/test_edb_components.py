@@ -29,6 +29,7 @@ import pytest
 
 # from pyedb import Edb
 from pyedb.dotnet.edb import Edb
+from pyedb.dotnet.edb_core.definition.component_def import EDBComponentDef
 from tests.conftest import desktop_version, local_path
 from tests.legacy.system.conftest import test_subfolder
 
@@ -353,6 +354,51 @@ class TestClass:
         assert edbapp.components.definitions["CAPMP7343X31N"].assign_spice_model(spice_path)
         edbapp.close()
 
+    def test_components_definitions_components_cache(self):
+        """Evaluate caching of the components of a component definition."""
+        source_path = os.path.join(local_path, "example_models", test_subfolder, "ANSYS-HSD_V1.aedb")
+        target_path = os.path.join(self.local_scratch.path, "test_0128.aedb")
+        self.local_scratch.copyfolder(source_path, target_path)
+        edbapp = Edb(target_path, edbversion=desktop_version)
+        comp_def = edbapp.components.definitions["CAPC2012X12N"]
+        comps = comp_def.components
+        assert comps
+        assert comp_def.components is comps
+        comp_def.invalidate_components()
+        refreshed = comp_def.components
+        assert refreshed is not comps
+        assert refreshed.keys() == comps.keys()
+        comp_def.part_name = "CAPC2012X12N_new"
+        renamed = comp_def.components
+        assert renamed is not refreshed
+        assert renamed.keys() == comps.keys()
+        uncached = EDBComponentDef(edbapp, comp_def._edb_object, use_cache=False)
+        first = uncached.components
+        assert uncached.components is not first
+        assert uncached.components.keys() == first.keys()
+        edbapp.close()
+
+    def test_components_definitions_parallel_assignment(self):
+        """Evaluate threaded model assignment on a component definition."""
+        source_path = os.path.join(local_path, "example_models", test_subfolder, "ANSYS-HSD_V1.aedb")
+        target_path = os.path.join(self.local_scratch.path, "test_0127.aedb")
+        self.local_scratch.copyfolder(source_path, target_path)
+        edbapp = Edb(target_path, edbversion=desktop_version)
+        comp_defs = [
+            comp_def
+            for comp_def in edbapp.components.definitions.values()
+            if comp_def.type == "Capacitor" and len(comp_def.components) > 16
+        ]
+        assert comp_defs
+        comp_def = comp_defs[0]
+        assert comp_def.assign_rlc_model(1, 2, 3, parallel=True)
+        assert all(comp.model_type == "RLC" for comp in comp_def.components.values())
+        sparam_path = os.path.join(local_path, "example_models", test_subfolder, "GRM32_DC0V_25degC_series.s2p")
+        assert comp_def.assign_s_param_model(sparam_path, parallel=True)
+        assert len(comp_def.reference_file) == 1
+        assert all(comp.s_param_model for comp in comp_def.components.values())
+        edbapp.close()
+
     def test_rlc_component_values_getter_setter(self):
         """Evaluate component values getter and setter."""
         source_path = os.path.join(local_path, "example_models", test_subfolder, "ANSYS-HSD_V1.aedb")
@@ -876,3 +876,22 @@ class TestClass:
             assert len(data["nets"]["signal_nets"]) == 342
             assert len(data["nets"]["power_ground_nets"]) == 6
         edbapp.close()
+
+    def test_17_deferred_section_parsing(self, edb_examples):
+        edbapp = edb_examples.get_si_verse()
+        cfg_data = edbapp.configuration.load({"components": [{"reference_designator": "U1", "part_type": "io"}]})
+        edbapp.configuration.load({"components": [{"reference_designator": "U2", "part_type": "io"}]})
+        assert len(cfg_data.components.components) == 1
+
+        u1_type = edbapp.components["U1"].type
+        data = {
+            "components": [{"reference_designator": "U1", "part_type": "io"}],
+            "setups": [{"name": "setup_without_type"}],
+        }
+        cfg_data = edbapp.configuration.load(data, append=False)
+        with pytest.raises(AttributeError):
+            cfg_data.parse()
+        with pytest.raises(AttributeError):
+            edbapp.configuration.load(data, append=False, apply_file=True)
+        assert edbapp.components["U1"].type == u1_type
+        edbapp.close()